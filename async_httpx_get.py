@@ -1,73 +1,145 @@
 # Tested on Python 3.12.0 with httpx==0.25.0
 # This module provides asynchronous functions to get response data a URL or URLs.
 # Run this module to test an example usage.
+# Install `httpx[http2]` to multiplex requests to the same host over HTTP/2.
 
 """
 Asynchronously get response data a URL or URLs.
 """
 
 import asyncio
-from itertools import batched
-from typing import Coroutine
+from importlib.util import find_spec
+from math import ceil
 
 import httpx
 
 
+# HTTP/2 support in httpx requires the optional `h2` package
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
 async def get_data(
+    client: httpx.AsyncClient,
     url: str,
-) -> Coroutine[None, None, httpx.Response]:
+    *,
+    retries: int = 2,
+    backoff: float = 0.1,
+) -> httpx.Response:
     """Asynchronously get response data from a URL. 
 
+    Requests that fail, respond with a server error (5xx), or are rate limited
+    (429) are retried with an exponentially increasing delay.
+
     Args:
+        client (httpx.AsyncClient): Client to send the request with. Reusing
+            the same client across requests keeps its connection pool alive.
         url (str): URL to get data from. 
+        retries (int, optional): Maximum number of retries after the first 
+            attempt. Defaults to 2.
+        backoff (float, optional): Delay in seconds before the first retry, 
+            doubled on each succeeding retry. Defaults to 0.1.
 
     Returns:
-        Coroutine[None, None, httpx.Response]: A coroutine that returns an
-            httpx.Response object. 
+        httpx.Response: The response for the URL. 
             
     Raises:
         httpx.HTTPStatusError: Raised when the status code is not 200.
         httpx.RequestError: Raised when the request fails. 
     """
-    try:
-        async with httpx.AsyncClient() as client:
+    for attempt in range(retries + 1):
+        if attempt:
+            await asyncio.sleep(backoff * 2 ** (attempt - 1))
+
+        try:
             response = await client.get(url)
-            return response
-    except httpx.HTTPStatusError as e:
-        return httpx.Response(status_code=e.response.status_code)
-    except httpx.RequestError:
-        return httpx.Response(status_code=500)
+        except httpx.HTTPStatusError as e:
+            response = httpx.Response(status_code=e.response.status_code)
+        except httpx.RequestError:
+            response = httpx.Response(status_code=500)
+
+        # Only server errors and rate limiting are worth retrying
+        if response.status_code < 500 and response.status_code != 429:
+            break
+
+    return response
     
 
 async def batched_get_data(
     urls: list[str],
     *,
     batch_len: int = 10,
-) -> Coroutine[None, None, list[httpx.Response]]:
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    http2: bool = HTTP2_AVAILABLE,
+) -> list[httpx.Response]:
     """Asynchronously get response data from a list of URLs. 
 
     Args:
         urls (list[str]): List of URLs to get data from. 
-        batch_len (int, optional): Batch length. Defaults to 10. 
+        batch_len (int, optional): Maximum number of requests in flight at 
+            any given time. Defaults to 10. 
+        max_connections (int | None, optional): Maximum number of concurrent
+            connections in the client's pool. Defaults to None, which sizes 
+            the pool to 1.5 times `batch_len`.
+        max_keepalive_connections (int | None, optional): Maximum number of 
+            idle connections kept alive in the pool. Defaults to None, which 
+            uses the value of `max_connections`.
+        http2 (bool, optional): Whether to enable HTTP/2, allowing requests to
+            the same host to share a single connection. Defaults to True if 
+            the `h2` package is installed, otherwise False.
 
     Returns:
-        Coroutine[None, None, list[httpx.Response]]: A coroutine that returns a 
-            list of httpx.Response objects.
+        list[httpx.Response]: The responses for each URL, in the same order as
+            the given URLs.
     """
-    # Split the list of URLs into batches of a specified size
-    # and run the coroutine for each batch asynchronously
-    responses = []
-    for urls_batch in batched(urls, batch_len):
-        tasks = [get_data(url.strip()) for url in urls_batch]
-        responses.extend(await asyncio.gather(*tasks))
+    # Strip the URLs once up front, before they are used as keys for 
+    # deduplication
+    urls = [url.strip() for url in urls]
+
+    # Size the connection pool to the batch length so that a full batch is
+    # never throttled by the pool, unless explicitly overridden
+    max_connections = max_connections or ceil(batch_len * 1.5)
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections or max_connections,
+    )
+    # Share a single client so connections are reused across all requests
+    async with httpx.AsyncClient(http2=http2, limits=limits) as client:
+        # Bound the number of requests in flight with a semaphore instead of
+        # awaiting fixed batches, so a slow request does not hold back the 
+        # start of the requests after it. This also keeps the number of
+        # concurrent HTTP/2 streams per connection in check.
+        semaphore = asyncio.Semaphore(batch_len)
+
+        async def bounded_get_data(url: str) -> httpx.Response:
+            async with semaphore:
+                return await get_data(client, url)
+
+        # Only one request is sent per unique URL; duplicate URLs share the
+        # task (and thus the response) of the first occurrence
+        unique_tasks: dict[str, asyncio.Task[httpx.Response]] = {}
+        tasks = []
+        async with asyncio.TaskGroup() as task_group:
+            for url in urls:
+                if url not in unique_tasks:
+                    unique_tasks[url] = task_group.create_task(
+                        bounded_get_data(url)
+                    )
+                tasks.append(unique_tasks[url])
         
-    return responses
+    return [task.result() for task in tasks]
     
 
 if __name__ == "__main__":
     # Test this module by comparing the time it took to complete all requests
     # by changing the `batch_len` value from 1 to 20 
     from time import perf_counter
+
+    # Prefer uvloop's faster event loop implementation when it is installed
+    try:
+        from uvloop import new_event_loop
+    except ImportError:
+        from asyncio import new_event_loop
     
     # Change this value to change the batch size
     batch_len = 20  
@@ -125,7 +197,15 @@ if __name__ == "__main__":
         "https://books.toscrape.com/catalogue/category/books/crime_51/index.html",
     ]
 
+    # Run tasks eagerly so that coroutines that can complete without blocking
+    # do not need an extra round-trip through the event loop
+    def eager_loop_factory() -> asyncio.AbstractEventLoop:
+        loop = new_event_loop()
+        loop.set_task_factory(asyncio.eager_task_factory)
+        return loop
+
     t0 = perf_counter()  # Start of timer
-    results = asyncio.run(batched_get_data(urls, batch_len=batch_len))
+    with asyncio.Runner(loop_factory=eager_loop_factory) as runner:
+        results = runner.run(batched_get_data(urls, batch_len=batch_len))
     dt =  perf_counter() - t0  # Elapsed time from start and end timer
     print(f"Done in {dt:.5f}s")
\ No newline at end of file
@@ -1,25 +1,60 @@
+import re
+
+
+# Regular expression to validate a card number of exactly 16 ASCII digits;
+# Checks both the length and the digits in a single call;
+_CARD_NUMBER_PATTERN: re.Pattern = re.compile(r"[0-9]{16}")
+
+# Byte masks for computing the Luhn checksum on all 16 ASCII digits at once, 
+# packed into a single 128-bit integer with one digit per byte (SWAR)
+_ASCII_ZEROS = int.from_bytes(b"0" * 16, "big")
+_DOUBLED_DIGITS = int.from_bytes(b"\xff\x00" * 8, "big")
+_DOUBLED_THREES = int.from_bytes(b"\x03\x00" * 8, "big")
+_DOUBLED_ONES = int.from_bytes(b"\x01\x00" * 8, "big")
+_ALL_ONES = int.from_bytes(b"\x01" * 16, "big")
+
+
 def is_valid_credit_card(card_number: str) -> bool:
     """Checks if a number is a valid Visa credit card (16 digits) using Luhn."""
     if not isinstance(card_number, str):
         raise TypeError("Card number must be a string.")
     else:
-        if not card_number.isdigit() or len(card_number) != 16:
+        if not _CARD_NUMBER_PATTERN.fullmatch(card_number):
             raise ValueError("Card number must be a 16-digit number.")
 
-    digits = (int(d) for d in card_number)
-    total = 0
-    for pos, digit in enumerate(digits):
-        if digit < 0 or digit > 9:
-            return False
-        total += digit if pos % 2 else digit * 2 // 10 + digit * 2 % 10
+    # Subtract ASCII "0" from every byte to get the digit values
+    digits = int.from_bytes(card_number.encode(), "big") - _ASCII_ZEROS
+    
+    # Every other digit, starting from the leftmost, is doubled, and 9 is 
+    # subtracted if the result is greater than 9. Digits that are at least 5
+    # are flagged by adding 3 and checking the 4th bit of each byte.
+    doubled = digits & _DOUBLED_DIGITS
+    over_nine = ((doubled + _DOUBLED_THREES) >> 3) & _DOUBLED_ONES
+    digits += doubled - 9 * over_nine
+
+    # Sum all bytes into the most significant byte; each byte is at most 9 so
+    # the sum (at most 144) never overflows into the next byte
+    total = ((digits * _ALL_ONES) >> 120) & 0xFF
     return total % 10 == 0
 
 
 if __name__ == "__main__":
-    from string import digits
-    from random import choice
+    import numpy as np
+
+    rng = np.random.default_rng()
+    # Digits at even positions, starting from the leftmost, are doubled
+    doubled = np.tile([True, False], 8)
 
     while True:
-        cc_number = "".join(choice(digits) for _ in range(16))
-        if is_valid_credit_card(cc_number):
-            print(cc_number)
\ No newline at end of file
+        # Generate candidates in bulk, one card number of ASCII digits per row,
+        # and run the Luhn check on all rows at once
+        candidates = rng.integers(
+            ord("0"), ord("9") + 1, size=(65536, 16), dtype=np.uint8
+        )
+        digits = candidates - ord("0")
+        luhn = np.where(doubled, digits * 2, digits)
+        luhn = np.where(luhn > 9, luhn - 9, luhn)
+        valid = luhn.sum(axis=1) % 10 == 0
+
+        for cc_number in candidates[valid]:
+            print(cc_number.tobytes().decode())
\ No newline at end of file
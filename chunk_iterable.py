@@ -1,8 +1,13 @@
-from collections import deque
 from collections.abc import Iterator
+from itertools import islice
 from typing import Any, Iterable
 
 
+# Built-in sequence types whose slices are of the same type, which allows 
+# chunking by slicing instead of iterating element by element
+_SLICEABLE_TYPES = (list, tuple, bytes, bytearray)
+
+
 def chunk_iterable(
     iterable: Iterable,
     n: int = 1,
@@ -23,7 +28,7 @@ def chunk_iterable(
             iterable type. Default is True. If False, chunks are yielded as 
             tuples instead.
 
-    Yields:
+    Returns:
         Iterator[Iterable[Any]]: An iterator yielding chunks of the input 
                                  iterable.
         
@@ -31,12 +36,15 @@ def chunk_iterable(
         TypeError: If `iterable` is not an iterable or the `n` is not an integer.
         ValueError: If `n` is not a positive integer.
     """
-    # Validate arguments
-    # Equivalent to iterable=iter(iterable) which raises a TypeError exception
-    # if iterable cannot be iterated.
-    if not isinstance(iterable, Iterable):
+    # Validate arguments eagerly, i.e. when called rather than on the first
+    # iteration, by keeping the generator in a separate function.
+    # iter(iterable) raises a TypeError exception if iterable cannot be 
+    # iterated, and is cheaper than an isinstance check against the ABC.
+    try:
+        iter(iterable)
+    except TypeError:
         raise TypeError("Iterable to be chunked expected type `Iterable`, "
-                        f"not `{type(iterable).__name__}`.")
+                        f"not `{type(iterable).__name__}`.") from None
 
     if not isinstance(n, int):
         raise TypeError("Chunk size expected type `int`, "
@@ -49,19 +57,29 @@ def chunk_iterable(
     if n <= 0:
         raise ValueError("Chunk size must be a positive integer.")
     
-    # Perform chunking of iterable
+    return _chunk_iterable(iterable, n, preserve_iterable_type)
+
+
+def _chunk_iterable(
+    iterable: Iterable,
+    n: int,
+    preserve_iterable_type: bool,
+) -> Iterator[Iterable[Any]]:
+    # Perform chunking of iterable, assumes arguments are already validated
     # Handle str type separately
     if isinstance(iterable, str):
         for i in range(0, len(iterable), n):
             yield iterable[i:i + n]
+    # Exact type check since slicing a subclass returns the base type
+    elif preserve_iterable_type and type(iterable) in _SLICEABLE_TYPES:
+        for i in range(0, len(iterable), n):
+            yield iterable[i:i + n]
     else:
-        dequed = deque(iterable)
-        while dequed:
-            # Preserve iterable type
-            if preserve_iterable_type:
-                yield type(iterable)(dequed.popleft() for _ in range(n) if dequed)
-            else:
-                yield tuple(dequed.popleft() for _ in range(n) if dequed)
+        # Preserve iterable type
+        chunk_type = type(iterable) if preserve_iterable_type else tuple
+        iterator = iter(iterable)
+        while chunk := chunk_type(islice(iterator, n)):
+            yield chunk
                 
             
 if __name__ == "__main__":
@@ -98,6 +116,13 @@ if __name__ == "__main__":
             actual = list(chunk_iterable(iterable))
             self.assertEqual(expected, actual)
             
+        def test_chunk_bytes_into_4s(self):
+            iterable = b"abcdefghij"
+            chunk_size = 4
+            expected = [b"abcd", b"efgh", b"ij"]
+            actual = list(chunk_iterable(iterable, chunk_size))
+            self.assertEqual(expected, actual)
+            
         def test_chunk_str_into_2s(self):
             iterable = "abcdefghij"
             chunk_size = 2
@@ -144,6 +169,10 @@ if __name__ == "__main__":
                 exception_context.exception.args[0]
             )
         
+        def test_chunk_validates_on_call(self):
+            with self.assertRaises(ValueError):
+                chunk_iterable([1, 2, 3], 0)
+        
         def test_chunk_bool_into_2s(self):
             iterable = True
             chunk_size = 2
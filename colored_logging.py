@@ -1,4 +1,6 @@
 import logging
+import os
+import sys
 from typing import Iterable, TypedDict, override, NotRequired
 
 from termcolor import colored
@@ -32,25 +34,123 @@ class ColoredStreamHandler(logging.StreamHandler):
     Args:
         colors (dict[int, _TermColorStyle]): A dictionary mapping log levels to color names.
         *args: Variable length argument list for the parent class.
+        flush_level (int): Minimum log level of records that flush the stream
+            after being written. Records below this level are left in the 
+            stream's buffer, which saves a write per record on buffered 
+            streams such as files. Defaults to logging.NOTSET (always flush).
+        force_color (bool): Color the output even when the stream is not a 
+            terminal or the ANSI_COLORS_DISABLED or NO_COLOR environment 
+            variables are set. Defaults to False.
         **kwargs: Arbitrary keyword arguments for the parent class.
     """
-    def __init__(self, styles: dict[int, _TermColorStyle] | None = _STYLES, *args, **kwargs):
+    def __init__(
+        self, 
+        styles: dict[int, _TermColorStyle] | None = _STYLES, 
+        *args, 
+        flush_level: int = logging.NOTSET, 
+        force_color: bool = False,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
 
         # Set the colors dictionary, default to an empty dict if not provided
         self.styles = styles if styles is not None else {}
+        self.flush_level = flush_level
+        self.force_color = force_color
+        self._color_enabled = self._can_color()
+
+        # Sort the log levels in descending order once, and cache the resolved
+        # style of each log level seen, since styles do not change after init
+        self._sorted_levels = sorted(self.styles.keys(), reverse=True)
+        self._level_styles: dict[int, _TermColorStyle] = {}
+        self._level_ansi: dict[int, tuple[str, str]] = {}
+
+    def _can_color(self) -> bool:
+        """
+        Determine whether to color the stream, checking the same environment 
+        variables in the same order as termcolor, but testing whether this 
+        handler's stream is a terminal instead of sys.stdout.
+        """
+        if self.force_color:
+            return True
+
+        if "ANSI_COLORS_DISABLED" in os.environ:
+            return False
+        if "NO_COLOR" in os.environ:
+            return False
+        if "FORCE_COLOR" in os.environ:
+            return True
+
+        # Only color terminals, so piped or redirected output stays free of 
+        # escape sequences
+        if os.environ.get("TERM") == "dumb" or sys.platform == "emscripten":
+            return False
+
+        isatty = getattr(self.stream, "isatty", None)
+        return isatty is not None and isatty()
+
+    @override
+    def setStream(self, stream):
+        """Overridden to decide again whether to color the new stream."""
+        result = super().setStream(stream)
+        self._color_enabled = self._can_color()
+        self._level_ansi.clear()
+        return result
 
     def _get_style_for_level(self, levelno: int) -> _TermColorStyle:
         """Determine the appropriate style based on the log level."""
-        # Sort the log levels in descending order to find the closest matching level
-        sorted_levels = sorted(self.styles.keys(), reverse=True)
+        if (style := self._level_styles.get(levelno)) is not None:
+            return style
 
-        for level in sorted_levels:
-            if levelno >= level:
-                return self.styles[level]
-            
         # Default to no color if no match is found
-        return {"color": None, "on_color": None, "attrs": None}
+        style = {"color": None, "on_color": None, "attrs": None}
+
+        # Find the closest matching level
+        for level in self._sorted_levels:
+            if levelno >= level:
+                style = self.styles[level]
+                break
+
+        self._level_styles[levelno] = style
+        return style
+
+    def _get_ansi_for_level(self, levelno: int) -> tuple[str, str]:
+        """Determine the ANSI escape sequences to surround a message with."""
+        if (ansi := self._level_ansi.get(levelno)) is not None:
+            return ansi
+
+        # Get the style based on the log level
+        style = self._get_style_for_level(levelno)
+        ansi = ("", "")
+
+        # A style may force its level to be colored, or not, regardless of 
+        # whether the handler colors its stream
+        if style.get("no_color"):
+            color_enabled = False
+        elif style.get("force_color"):
+            color_enabled = True
+        else:
+            color_enabled = self._color_enabled
+
+        if color_enabled:
+            color = style.get("color", None)
+            on_color = style.get("on_color", None)
+            attrs = style.get("attrs", None)
+
+            # Apply the color, highlight, and attributes using termcolor.colored
+            # once on a placeholder; since termcolor only surrounds the text 
+            # with escape sequences, the result splits into a prefix and suffix.
+            # Whether to color was already decided for this handler's stream, 
+            # so keep termcolor from checking sys.stdout instead
+            if color or on_color or attrs:
+                placeholder = colored(
+                    "\0", color=color, on_color=on_color, attrs=attrs, force_color=True
+                )
+                prefix, _, suffix = placeholder.partition("\0")
+                ansi = (prefix, suffix)
+
+        self._level_ansi[levelno] = ansi
+        return ansi
     
     @override
     def emit(self, record: logging.LogRecord):
@@ -58,24 +158,17 @@ class ColoredStreamHandler(logging.StreamHandler):
             # Format the log message
             message = self.format(record)
 
-            # Get the style based on the log level
-            style = self._get_style_for_level(record.levelno)
+            # Look up the cache directly to skip a method call in the common case
+            levelno = record.levelno
+            prefix, suffix = (
+                self._level_ansi.get(levelno) 
+                or self._get_ansi_for_level(levelno)
+            )
+            self.stream.write(prefix + message + suffix + self.terminator)
 
-            if style.get("force_color"):
-                self.stream.write(message + self.terminator)
-
-            else:
-                color = style.get("color", None)
-                on_color = style.get("on_color", None)
-                attrs = style.get("attrs", None)
-
-                # Apply the color, highlight, and attributes using termcolor.colored
-                if style.get("force_color", False) or (color or on_color or attrs):
-                    message = colored(message, color=color, on_color=on_color, attrs=attrs)
-                    
-                self.stream.write(message + self.terminator)
-
-            self.flush()
+            # Buffered records are still flushed by logging.shutdown() at exit
+            if levelno >= self.flush_level:
+                self.flush()
 
         except Exception:
             self.handleError(record)
@@ -83,6 +176,9 @@ class ColoredStreamHandler(logging.StreamHandler):
 
 if __name__ == "__main__":
     # * Sample usage and demonstration of a colored logger
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
 
     # Set up a logger
     logger = logging.getLogger(__name__)
@@ -100,8 +196,17 @@ if __name__ == "__main__":
     # Set the formatter to the created custom handler
     colored_handler.setFormatter(formatter)
 
-    # Add the handler to the logger
-    logger.addHandler(colored_handler)
+    # Add the handler to the logger through a queue, so that the handler's 
+    # formatting, coloring, and writing happen on the listener's background 
+    # thread. QueueHandler still merges the message with its arguments and 
+    # renders any exception on the thread that logs the message
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, colored_handler, respect_handler_level=True)
+    listener.start()
+
+    # Stop the listener on exit, which writes any remaining queued records
+    atexit.register(listener.stop)
 
     # Test the logging with standard log levels
     logger.debug('This is a debug message.')
@@ -112,6 +217,8 @@ if __name__ == "__main__":
     try:
         num = 1/0
     except Exception as e:
-        logger.exception(f"This is an exception message: {e}")
+        # Pass arguments separately instead of an f-string, so the message is
+        # not formatted for records filtered out by level
+        logger.exception("This is an exception message: %s", e)
 
     logger.critical('This is a critical message.')
\ No newline at end of file
@@ -1,5 +1,9 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import count
 from logging.handlers import RotatingFileHandler
 from typing import override, Literal
+import io
+import logging
 import os
 import shutil
 import bz2
@@ -8,6 +12,11 @@ import lzma
 import zipfile
 import tarfile
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 __all__ = [
     "CompressedRotatingFileHandler",
@@ -25,15 +34,26 @@ compression methods are:
 - `gz`: Gzip compression
 - `bz2`: Bzip2 compression
 - `xz` or `lzma`: Xz and Lzma compression
+- `zst`: Zstandard compression (requires the `zstandard` package)
 - `tar`: Tar archive without compression
 - `tar.gz`, `tar.bz2`, `tar.xz`, or `tar.lzma`: Tar archive with compression
+- `tar.zst`: Tar archive with Zstandard compression (requires `zstandard`)
+
+Zstandard compresses at a similar ratio to gzip at many times the speed, which
+shortens rollovers of large log files.
+
+The `compresslevel` parameter sets the compression level (the preset for xz 
+and lzma) and defaults to 3. Logs are rarely kept long enough to warrant the 
+slowest level 9, which takes about three times as long as level 3 to compress
+text for only a few percent smaller files. Gzip files are written without a 
+timestamp, so the same log always compresses to the same bytes.
 """
 
 # Valid compression literals
 Compression = Literal[
     "zip", 
-    "gz", "bz2", "xz", "lzma",
-    "tar", "tar.gz", "tar.bz2", "tar.xz", "tar.lzma"
+    "gz", "bz2", "xz", "lzma", "zst",
+    "tar", "tar.gz", "tar.bz2", "tar.xz", "tar.lzma", "tar.zst"
 ]
 
 
@@ -56,6 +76,7 @@ class CompressedRotatingFileHandler(RotatingFileHandler):
             encoding: str | None = None, 
             delay: bool = False, 
             errors: str | None = None,
+            compresslevel: int = 3,  # new parameter
         ) -> None:
 
         super().__init__(
@@ -69,13 +90,39 @@ class CompressedRotatingFileHandler(RotatingFileHandler):
                 .format(", ".join(Compression.__args__))
             )
 
+        if compression.endswith("zst") and zstandard is None:
+            raise ImportError(
+                f"Compression mode {compression} requires the `zstandard` "
+                "package to be installed."
+            )
+
         self.compression = compression
+        self.compresslevel = compresslevel
+
+        # Backups are shifted and compressed on a single background thread so
+        # that logging is not blocked during compression; a single worker 
+        # keeps consecutive rollovers in order
+        self._rollover_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="CompressedRotatingFileHandler"
+        )
+        self._rollover_ids = count(1)
+        self._pending_rollovers: set[str] = set()
+        self._rollover_closed = False
+
+        # Rotated log files left behind by a failed rollover, possibly of an 
+        # earlier process, would otherwise pile up
+        self._remove_stale_rollovers()
 
 
     @override
     def doRollover(self) -> None:
         """
         Overridden to compress the log file after rotation.
+
+        Only the base log file is renamed synchronously; shifting the backups 
+        and compressing the renamed log file is done on a background thread.
+        Once the handler is closed, records may still be logged, such as from 
+        daemon threads, and their rollovers are done synchronously instead.
         """
         
         if self.stream:
@@ -83,29 +130,139 @@ class CompressedRotatingFileHandler(RotatingFileHandler):
             self.stream = None  # type: ignore
 
         if self.backupCount > 0:
-            for i in range(self.backupCount - 1, 0, -1):
-                src = f"{self.baseFilename}.{i}.{self.compression}"
-                dest_file = f"{self.baseFilename}.{i + 1}.{self.compression}"
+            # The executor takes no more work once the handler is closed
+            background = not self._rollover_closed
 
-                if os.path.exists(src):
-                    if os.path.exists(dest_file):
-                        os.remove(dest_file)
-                    os.rename(src, dest_file)
+            # Move the base log file aside under a unique name, so that it can 
+            # be reopened immediately, even if earlier rollovers are pending
+            log_file = None
+            if os.path.exists(self.baseFilename):
+                # Skip names still taken by leftovers of an earlier process
+                log_file = "{}.{}.rollover".format(
+                    self.baseFilename, next(self._rollover_ids)
+                )
+                while os.path.exists(log_file):
+                    log_file = "{}.{}.rollover".format(
+                        self.baseFilename, next(self._rollover_ids)
+                    )
+                if background:
+                    self._pending_rollovers.add(log_file)
+                os.rename(self.baseFilename, log_file)
 
-            # The base log file (not compressed yet)
-            log_file = self.baseFilename
+            if background:
+                try:
+                    future = self._rollover_executor.submit(
+                        self._rotate_backups, log_file
+                    )
+                except RuntimeError:
+                    # No new threads are started once the interpreter is 
+                    # shutting down
+                    self._pending_rollovers.discard(log_file)  # type: ignore
+                    background = False
+                else:
+                    future.add_done_callback(
+                        lambda future: self._rollover_done(log_file, future)
+                    )
 
-            dest_file = f"{self.baseFilename}.1.{self.compression}"
-            
-            # Compress the base log file
-            if os.path.exists(log_file):
-                self._compress_log_file(log_file, dest_file)
-                os.remove(log_file)
+            if not background:
+                # Errors are reported by emit, but leftovers are still bounded
+                try:
+                    self._rotate_backups(log_file)
+                except Exception:
+                    self._remove_stale_rollovers()
+                    raise
 
         if not self.delay:
             self.stream = self._open()
 
 
+    @override
+    def close(self) -> None:
+        """
+        Overridden to wait for pending compressions before closing.
+        """
+        self._rollover_closed = True
+        self._rollover_executor.shutdown(wait=True)
+        super().close()
+
+
+    def _rollover_done(self, log_file: str | None, future: Future) -> None:
+        """
+        Reports an error raised while rotating the backups in the background, 
+        as emit would for a rollover done in the foreground.
+        """
+        self._pending_rollovers.discard(log_file)  # type: ignore
+
+        try:
+            future.result()
+        except Exception:
+            self.handleError(logging.makeLogRecord({
+                "msg": "Unable to rotate the backups of %s",
+                "args": (self.baseFilename,),
+            }))
+            self._remove_stale_rollovers()
+
+
+    def _remove_stale_rollovers(self) -> None:
+        """
+        Removes the oldest rotated log files that are not waiting to be 
+        compressed, keeping at most `backupCount` of them.
+        """
+        directory, base_name = os.path.split(self.baseFilename)
+
+        # The directory may not exist yet when the file is opened lazily
+        if not os.path.isdir(directory):
+            return
+
+        with os.scandir(directory) as entries:
+            stale = [
+                entry for entry in entries 
+                if entry.name.startswith(f"{base_name}.") 
+                and entry.name.endswith(".rollover")
+                and entry.path not in self._pending_rollovers
+            ]
+
+        stale.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in stale[self.backupCount:]:
+            os.remove(entry.path)
+
+
+    def _rotate_backups(self, log_file: str | None) -> None:
+        """
+        Shifts the compressed backups and compresses the rotated log file into 
+        the first backup.
+        """
+        # List the existing backups with a single directory scan instead of
+        # checking whether each possible backup exists
+        directory, base_name = os.path.split(self.baseFilename)
+        with os.scandir(directory) as entries:
+            existing = {
+                entry.name for entry in entries 
+                if entry.name.startswith(f"{base_name}.")
+            }
+
+        for i in range(self.backupCount - 1, 0, -1):
+            src_name = f"{base_name}.{i}.{self.compression}"
+            dest_name = f"{base_name}.{i + 1}.{self.compression}"
+
+            if src_name in existing:
+                if dest_name in existing:
+                    os.remove(os.path.join(directory, dest_name))
+                os.rename(
+                    os.path.join(directory, src_name), 
+                    os.path.join(directory, dest_name),
+                )
+                existing.remove(src_name)
+                existing.add(dest_name)
+
+        dest_file = f"{self.baseFilename}.1.{self.compression}"
+        
+        # Compress the rotated log file
+        if log_file is not None:
+            self._compress_log_file(log_file, dest_file)
+            os.remove(log_file)
+
+
     def _compress_log_file(self, src: str, dest: str) -> None:
         """
         Compresses the log file using the specified compression method.
@@ -113,28 +270,116 @@ class CompressedRotatingFileHandler(RotatingFileHandler):
         self.compression: str # type hint as str
 
         if self.compression == "zip":
-            with zipfile.ZipFile(dest, "w", zipfile.ZIP_DEFLATED) as zipf:
-                zipf.write(src, arcname=os.path.basename(src))
+            with zipfile.ZipFile(
+                dest, "w", zipfile.ZIP_DEFLATED, compresslevel=self.compresslevel
+            ) as zipf:
+                zipf.write(src, arcname=os.path.basename(self.baseFilename))
 
         elif self.compression == "gz":
-            with open(src, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+            with (
+                open(src, "rb") as f_in, 
+                gzip.GzipFile(
+                    dest, "wb", compresslevel=self.compresslevel, mtime=0
+                ) as f_out,
+            ):
                 shutil.copyfileobj(f_in, f_out)
 
         elif self.compression == "bz2":
-            with open(src, "rb") as f_in, bz2.open(dest, "wb") as f_out:
+            with (
+                open(src, "rb") as f_in, 
+                bz2.open(dest, "wb", compresslevel=self.compresslevel) as f_out,
+            ):
                 shutil.copyfileobj(f_in, f_out)
 
         elif self.compression == "xz" or self.compression == "lzma":
-            with open(src, "rb") as f_in, lzma.open(dest, "wb") as f_out:
+            with (
+                open(src, "rb") as f_in, 
+                lzma.open(dest, "wb", preset=self.compresslevel) as f_out,
+            ):
                 shutil.copyfileobj(f_in, f_out)
 
+        elif self.compression == "zst":
+            with open(src, "rb") as f_in, open(dest, "wb") as f_out:
+                # threads=-1 compresses on as many threads as there are CPUs
+                compressor = zstandard.ZstdCompressor(
+                    level=self.compresslevel, threads=-1
+                )
+                compressor.copy_stream(f_in, f_out)
+
+        elif self.compression == "tar.zst":
+            # tarfile does not support zstd, so stream the tar archive through
+            # a zstd compressor instead
+            compressor = zstandard.ZstdCompressor(
+                level=self.compresslevel, threads=-1
+            )
+            with (
+                open(dest, "wb") as f_out,
+                compressor.stream_writer(f_out) as zst_out,
+                tarfile.open(fileobj=zst_out, mode="w|") as tarf,
+            ):
+                tarf.add(src, arcname=os.path.basename(self.baseFilename))
+
+        elif self.compression == "tar" and hasattr(os, "sendfile"):
+            self._tar_log_file(src, dest)
+
         elif self.compression.startswith("tar"):
             mode = self._get_tar_mode()
-            with tarfile.open(dest, mode) as tarf:
-                tarf.add(src, arcname=os.path.basename(src))
+            match mode:
+                case "w:gz" | "w:bz2":
+                    level = {"compresslevel": self.compresslevel}
+                case "w:xz":
+                    level = {"preset": self.compresslevel}
+                case _:
+                    level = {}
+
+            with tarfile.open(dest, mode, **level) as tarf:
+                tarf.add(src, arcname=os.path.basename(self.baseFilename))
 
         else:
             raise ValueError(f"Unsupported compression: {self.compression}")
+
+
+    def _tar_log_file(self, src: str, dest: str) -> None:
+        """
+        Archives the log file into an uncompressed tar archive, copying its 
+        contents with os.sendfile.
+
+        Since the contents are stored as is, they are copied by the kernel
+        instead of being read into and written from Python in chunks, as 
+        tarfile.TarFile.add would do. The archive is laid out the same way as 
+        tarfile writes it, so only the header is built with tarfile.
+        """
+        with open(src, "rb") as f_in, open(dest, "wb") as f_out:
+            # Build the header as TarFile.add would, with an archive that is 
+            # only used for its settings and discarded
+            with tarfile.open(fileobj=io.BytesIO(), mode="w") as tarf:
+                tarinfo = tarf.gettarinfo(
+                    arcname=os.path.basename(self.baseFilename), fileobj=f_in
+                )
+                header = tarinfo.tobuf(tarf.format, tarf.encoding, tarf.errors)
+
+            # Write the header out before appending the contents after it
+            f_out.write(header)
+            f_out.flush()
+            out_fd, in_fd = f_out.fileno(), f_in.fileno()
+            offset = 0
+            while offset < tarinfo.size:
+                sent = os.sendfile(out_fd, in_fd, offset, tarinfo.size - offset)
+                if sent == 0:
+                    raise OSError(f"{src} was truncated while archiving it")
+                offset += sent
+
+            # Pad the contents to a whole block, then end the archive with two
+            # empty blocks, padded to a whole record
+            remainder = tarinfo.size % tarfile.BLOCKSIZE
+            padding = tarfile.BLOCKSIZE - remainder if remainder else 0
+            padding += 2 * tarfile.BLOCKSIZE
+
+            remainder = (len(header) + tarinfo.size + padding) % tarfile.RECORDSIZE
+            if remainder > 0:
+                padding += tarfile.RECORDSIZE - remainder
+
+            f_out.write(tarfile.NUL * padding)
         
         
     def _get_tar_mode(self) -> str:
@@ -40,26 +40,30 @@ def main() -> None:
 
     # Initialize the mouse controller
     mouse = ms.Controller()
+
+    # Bind constants and functions used in the loop to local variables, which
+    # are faster to look up than globals and attributes
+    step_size, delay, sleep = STEP_SIZE, DELAY, time.sleep
     
     # Start listening to the keyboard
     with kb.Listener(on_press=key_to_exit) as listener:
         # Bouncing DVD screensaver motion
         while not EXIT_FLAG:
             # Move the mouse
-            mouse_x += STEP_SIZE * direction_x
-            mouse_y += STEP_SIZE * direction_y
+            mouse_x += step_size * direction_x
+            mouse_y += step_size * direction_y
 
             # Check if the mouse hit the screen boundaries
-            if mouse_x <= 0 or mouse_x >= screen_x:
-                direction_x *= -1  # Change direction
-            if mouse_y <= 0 or mouse_y >= screen_y:
-                direction_y *= -1  # Change direction
+            if not 0 < mouse_x < screen_x:
+                direction_x = -direction_x  # Change direction
+            if not 0 < mouse_y < screen_y:
+                direction_y = -direction_y  # Change direction
 
             # Move the mouse to the new position
             mouse.position = (mouse_x, mouse_y)
 
             # Add a delay to control the speed of the motion
-            time.sleep(DELAY)
+            sleep(delay)
 
     # Stop listening to the keyboard
     listener.stop()
@@ -34,8 +34,13 @@ def generate_person() -> dict[str, str]:
     }
 
 
+def generate_people(n: int) -> list[dict[str, str]]:
+    return [generate_person() for _ in range(n)]
+
+
 if __name__ == "__main__":
     people = tdb.TinyDB("people.json", indent=2)
 
-    for _ in range(10):
-        people.insert(generate_person())
\ No newline at end of file
+    # Insert all people at once, since TinyDB rewrites the whole file on every
+    # insert
+    people.insert_multiple(generate_people(10))
\ No newline at end of file
@@ -2,9 +2,16 @@
 # Provides a fuzzy_search() function to search for similar strings in an 
 # iterable of strings
 
+from itertools import batched
 from typing import Iterable
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+
+
+# Number of lines scored at a time, which bounds memory usage when searching 
+# very large iterables such as lines of a file
+_BATCH_SIZE = 65536
 
 
 def fuzzy_search(
@@ -60,16 +67,27 @@ def fuzzy_search(
     # Create an empty list instance to append similar lines to
     similar_lines = list()
     
-    # Loop through the iterable of strings
-    for line in lines:
-        line = str(line).strip()  # Make sure it's a string
+    # Loop through the iterable of strings in batches
+    for batch in batched(lines, _BATCH_SIZE):
+        batch = [str(line).strip() for line in batch]  # Make sure it's a string
+
+        # Compute the fuzz ratios of the whole batch in a single call, which 
+        # runs in parallel across all CPUs
+        ratios = process.cdist(
+            [string], batch, 
+            scorer=fuzz.ratio, 
+            score_cutoff=threshold, 
+            dtype=np.float64, 
+            workers=-1,
+        )[0]
+
         # Compare fuzz ratio to the threshold level
-        if (ratio := fuzz.ratio(string, line)) >= threshold:
+        for i in np.flatnonzero(ratios >= threshold):
             similar_lines.append(
                 # If include_score is True, append the line with the fuzz ratio
-                (line, round(ratio, 2)) if include_score
+                (batch[i], round(float(ratios[i]), 2)) if include_score
                 # Else, append only the line 
-                else line
+                else batch[i]
             )
     
     # Return the list of similar lines
@@ -17,7 +17,10 @@ def is_palindrome(i: str | Number, /) -> bool:
         raise TypeError("Expected input to be `str` or `numbers.Number`, " 
                         f"got `{type(i).__name__}`.")
 
-    return str(i) == str(i)[::-1]
+    # Reversing with a slice and comparing runs in C, which is much faster than
+    # comparing characters pairwise in Python, even with early exit
+    s = str(i)
+    return s == s[::-1]
 
 
 if __name__ == "__main__":
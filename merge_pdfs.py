@@ -1,8 +1,7 @@
 from collections.abc import Iterable
-from genericpath import isdir
 from glob import glob
-from os import PathLike
-from os.path import basename, getmtime
+from os import PathLike, fsdecode, scandir
+from os.path import basename, getmtime, isdir
 from typing import Literal, AnyStr
 
 from pypdf import PdfWriter, PdfReader
@@ -18,6 +17,7 @@ Usage:
 
 
 _File = str | bytes | PathLike
+_FILE_TYPES = (str, bytes, PathLike)
 _Order = Literal["none", "name", "date"]
 
 # Helper function to get files by fila names, glob pattern, or directory
@@ -33,11 +33,17 @@ def _get_files(
     if files is None and pattern is None and directory is None:
         raise ValueError("Either 'files', 'pattern', or 'directory' must be provided.")
     elif files is not None:
-        return [basename(file) for file in files]
+        return list(files)
     elif pattern is not None:
-        return [basename(file) for file in glob(pathname=pattern)]
+        return glob(pathname=pattern)
     elif directory is not None:
-        return [basename(file) for file in glob(pathname=f"{directory}/*")]
+        # Paths are kept whole so that files outside the working directory can
+        # still be read; only the pdf files of the directory are listed
+        with scandir(directory) as entries:
+            return [
+                entry.path for entry in entries 
+                if entry.is_file() and fsdecode(entry.name).lower().endswith(".pdf")
+            ]
     else:
         return []
 
@@ -53,9 +59,10 @@ def _sort_files(
     if order == "none":
         return list(files)
     elif order == "name":
-        return sorted(files, key=lambda f: basename(f), reverse=not ascending)
+        return sorted(files, key=basename, reverse=not ascending)
     elif order == "date":
-        return sorted(files, key=lambda f: getmtime(f), reverse=not ascending)
+        # sorted calls the key once per file, so each file is stat'ed once
+        return sorted(files, key=getmtime, reverse=not ascending)
     else:
         raise ValueError(f"Invalid order: {order}; expected 'none', 'name', or 'date'")
 
@@ -71,7 +78,7 @@ def merge_pdfs(
     if not isinstance(pdfs, list):
         raise TypeError(f"Invalid list of pdfs type: {type(pdfs).__name__}; expected list")
     
-    if not all(isinstance(pdf, _File.__args__) for pdf in pdfs):
+    if not all(isinstance(pdf, _FILE_TYPES) for pdf in pdfs):
         raise TypeError(f"Invalid pdf file name type: {type(pdfs).__name__}; expected str, bytes, or PathLike")
 
     if not isinstance(output, str):
@@ -85,18 +92,22 @@ def merge_pdfs(
     with PdfWriter() as merger:
         for pdf in pdfs:
             try:
-                if isdir(pdf):
-                    raise IsADirectoryError(f"Not a valid file (a directory was given): {pdf}")
-
-                # Try to open file if valid pdf
-                pdf_read = PdfReader(pdf) 
-
-                # Then append to the pdf to be merged
-                merger.append(pdf_read)
+                # Try to open file if valid pdf, then append it to the pdf to 
+                # be merged; appending copies the pages into the writer, so 
+                # the reader's file contents and parsed objects are released 
+                # right after instead of being held until the output is written
+                with PdfReader(pdf) as pdf_read:
+                    merger.append(pdf_read)
 
                 results["merged"].append(pdf)
 
             except (PyPdfError, FileNotFoundError, IsADirectoryError, PermissionError) as e:
+                # Directories are only told apart once opening them fails 
+                # (with PermissionError on Windows), which saves a stat call 
+                # for every valid file
+                if isinstance(e, OSError) and isdir(pdf):
+                    e = IsADirectoryError(f"Not a valid file (a directory was given): {pdf}")
+
                 if skip_invalid:
                     results["skipped"].append(pdf)
                     continue
@@ -1,9 +1,10 @@
+from contextvars import ContextVar
 from functools import wraps
 from inspect import iscoroutinefunction, getfullargspec
-from asyncio import sleep as async_sleep
-from time import sleep
+from asyncio import Semaphore, gather, sleep as async_sleep
+from time import perf_counter, sleep
 from random import uniform
-from collections.abc import Callable, Iterable
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any
 
 
@@ -14,7 +15,11 @@ between each attempt.The decorator supports both synchronous and asynchronous
 functions.
 """
 
-__version__ = "1.1.0"
+__version__ = "1.2.0"
+
+# Delays shorter than this, in seconds, are waited out by spinning on 
+# perf_counter, since time.sleep overshoots them by the OS timer slack
+_SPIN_THRESHOLD = 1e-4
 
 
 class MaxRetryExceededError(Exception):
@@ -67,38 +72,32 @@ class retry:
     ) -> None:
         if not isinstance(max_retries, int):
             raise TypeError(
-                "Type of `max_retries` must be `int`. Got `{}`."
-                .format(type(max_retries).__name__)
+                f"Type of `max_retries` must be `int`. Got `{type(max_retries).__name__}`."
             )
 
         if max_retries == 0:
             raise ValueError(
-                "Value of `max_retries` must be a non-zero integer. Got `{}`."
-                .format(max_retries)
+                f"Value of `max_retries` must be a non-zero integer. Got `{max_retries}`."
             )
 
         if not isinstance(delay, float):
             raise TypeError(
-                "Type of `delay` must `float`. Got `{}`."
-                .format(type(delay).__name__)
+                f"Type of `delay` must `float`. Got `{type(delay).__name__}`."
             )
 
         if delay < 0:
             raise ValueError(
-                "Value of `delay` must be a non-negative integer. Got `{}`."
-                .format(delay)
+                f"Value of `delay` must be a non-negative integer. Got `{delay}`."
             )
         
         if not isinstance(jitter, float):
             raise TypeError(
-                "Type of `jitter` must be `float`. Got `{}`."
-                .format(type(jitter).__name__)
+                f"Type of `jitter` must be `float`. Got `{type(jitter).__name__}`."
             )
         
         if jitter < 0:
             raise ValueError(
-                "Value of `jitter` must be a non-negative integer. Got `{}`."
-                .format(jitter)
+                f"Value of `jitter` must be a non-negative integer. Got `{jitter}`."
             )
         
         
@@ -107,11 +106,14 @@ class retry:
             if not issubclass(exceptions, BaseException):
                 raise TypeError(
                     "Type of `exceptions` must be a subclass of `BaseException`."
-                    " Got `{}`"
-                    .format(type(exceptions).__name__)
+                    f" Got `{exceptions.__name__}`"
                 )
             exceptions = (exceptions,)
         elif isinstance(exceptions, Iterable):
+            # Store the exceptions as a tuple, which is what `except` accepts,
+            # and which is not consumed by validation unlike an iterator
+            exceptions = tuple(exceptions)
+
             # Ensure all are subclasses of BaseException   
             if not all(issubclass(exc, BaseException) for exc in exceptions):
                 raise TypeError(
@@ -126,20 +128,20 @@ class retry:
 
         # Validate backoff if callable and two
         if callable(backoff):
-            backoff_argspec = getfullargspec(backoff)
-            if len(backoff_argspec.args) != 2:
+            # Count the arguments of functions from their code object, and 
+            # only inspect the full signature of other callables
+            backoff_code = getattr(backoff, "__code__", None)
+            backoff_argcount = backoff_code.co_argcount \
+                if backoff_code is not None \
+                else len(getfullargspec(backoff).args)
+            if backoff_argcount != 2:
                 raise ValueError(
                     "The `backoff` function must accept exactly 2 arguments."
                 )
         elif backoff is not None:
             raise TypeError(
-                "Type of `backoff` must be `Callable`. Got `{}`."
-                .format(type(backoff).__name__)
+                f"Type of `backoff` must be `Callable`. Got `{type(backoff).__name__}`."
             )
-        # If backoff is None, declare a lambda function that returns the delay
-        # value without modification due to backoff strategy.
-        else:
-            backoff = lambda delay, attempt: delay  # noqa: E731
 
         self.max_retries = max_retries
         self.delay = delay
@@ -149,78 +151,241 @@ class retry:
         self.backoff = backoff
 
 
+    @staticmethod
+    def decorrelated_jitter(cap: float, /) -> Callable[[float, int], float]:
+        """
+        Creates a backoff function with decorrelated jitter, where each delay
+        is drawn between the base delay and three times the previous delay. 
+        Unlike a fixed jitter, concurrent callers retrying the same resource 
+        drift apart instead of retrying at the same times.
+
+        The previous delay is kept per thread and per asyncio task, so calls 
+        running concurrently in separate threads or tasks, such as those of 
+        `retry.gather`, each follow their own schedule.
+
+        Sample Usage:
+            @retry(delay=0.1, backoff=retry.decorrelated_jitter(10.0))
+            def my_function():
+                ...
+
+        Args:
+            cap (float): The maximum delay in seconds.
+
+        Raises:
+            TypeError: For incorrect argument types.
+            ValueError: For incorrect argument values.
+
+        Returns:
+            Callable[[float, int], float]: The backoff function, which uses 
+                the `delay` of the decorator as the base delay.
+        """
+        if not isinstance(cap, float):
+            raise TypeError(f"Type of `cap` must be `float`. Got `{type(cap).__name__}`.")
+
+        if cap < 0:
+            raise ValueError(f"Value of `cap` must be non-negative. Got `{cap}`.")
+
+        # A context variable rather than a closure variable, since threads 
+        # and asyncio tasks each run in their own context
+        previous: ContextVar[float] = ContextVar("previous")
+
+        def backoff(delay: float, attempt: int) -> float:
+            # Start over from the base delay on the first retry of each call
+            last = delay if attempt == 1 else previous.get(delay)
+            last = min(cap, uniform(delay, last * 3))
+            previous.set(last)
+            return last
+
+        return backoff
+
+
+    @staticmethod
+    def exponential(factor: float = 2.0) -> Callable[[float, int], float]:
+        """
+        Creates a backoff function that multiplies the delay by `factor` on 
+        every retry, starting from the base delay on the first retry.
+
+        Sample Usage:
+            @retry(delay=0.1, max_delay=10.0, backoff=retry.exponential())
+            def my_function():
+                ...
+
+        Args:
+            factor (float): The multiplier applied to the delay on each retry.
+                Defaults to 2.0.
+
+        Raises:
+            TypeError: For incorrect argument types.
+            ValueError: For incorrect argument values.
+
+        Returns:
+            Callable[[float, int], float]: The backoff function, which uses 
+                the `delay` of the decorator as the base delay.
+        """
+        if not isinstance(factor, float):
+            raise TypeError(f"Type of `factor` must be `float`. Got `{type(factor).__name__}`.")
+
+        if factor < 1:
+            raise ValueError(f"Value of `factor` must be at least 1. Got `{factor}`.")
+
+        def backoff(delay: float, attempt: int) -> float:
+            try:
+                return delay * factor ** (attempt - 1)
+            except OverflowError:
+                # Reached only after very many retries; max_delay caps it
+                return float("inf") if delay else 0.0
+
+        return backoff
+
+
     def __call__(self, func: Callable[..., Any], /) -> Callable[..., Any]:
         if not callable(func):
             raise TypeError("The `func` argument must be callable.")
-           
-        @wraps(func)
-        def sync_wrapper(*args, **kwargs) -> Any:
-            attempts = 0
 
-            # If tries is negative, allow infinite retries. Use another variable to 
-            # allow infinite values since only float allows this
-            max_retries = self.max_retries if self.max_retries > 0 \
-                else float("inf")
-
-            while attempts <= max_retries:
-                try:
-                    # Execute function (sync or async based on wrapper)
-                    return func(*args, **kwargs)
+        # Read the settings once when decorating instead of on every attempt.
+        # If tries is negative, allow infinite retries. Use another variable to 
+        # allow infinite values since only float allows this
+        max_retries = self.max_retries if self.max_retries > 0 \
+            else float("inf")
+        base_delay = self.delay
+        max_delay = self.max_delay
+        jitter = self.jitter
+        exceptions = self.exceptions
+        backoff = self.backoff
+
+        # Without any delay, jitter, or backoff, attempts are retried right 
+        # away instead of computing and sleeping for a zero delay
+        wait = base_delay > 0 or jitter > 0 or backoff is not None
+
+        # Helper function shared by both wrappers to calculate the delay
+        # before the next attempt
+        def next_delay(attempts: int) -> float:
+            # Calculate delay with optional backoff and jitter
+            delay = backoff(base_delay, attempts) if backoff else base_delay
+            delay += uniform(-jitter, jitter)
+
+            # Cap delay if max_delay is set
+            if max_delay is not None:
+                delay = min(delay, max_delay)
+
+            return delay
+           
+        # Only build the wrapper that matches the function
+        if not iscoroutinefunction(func):
+            @wraps(func)
+            def sync_wrapper(*args, **kwargs) -> Any:
+                attempts = 0
+
+                while attempts <= max_retries:
+                    try:
+                        # Execute function (sync or async based on wrapper)
+                        return func(*args, **kwargs)
                 
-                except self.exceptions as exc: # type: ignore
-                    attempts += 1
+                    except exceptions as exc: # type: ignore
+                        attempts += 1
 
-                    if attempts == max_retries:
-                        raise MaxRetryExceededError(
-                            "Maximum number of retries ({}) exceeded."
-                            .format(self.max_retries)
-                        ) from exc
+                        if attempts == max_retries:
+                            raise MaxRetryExceededError(
+                                f"Maximum number of retries ({self.max_retries}) exceeded."
+                            ) from exc
 
-                    # Calculate delay with optional backoff and jitter
-                    delay = self.backoff(self.delay, attempts) if self.backoff \
-                        else self.delay
-                    delay += uniform(-self.jitter, self.jitter)
+                        if not wait:
+                            continue
 
-                    # Cap delay if max_delay is set
-                    if self.max_delay is not None:
-                        delay = min(delay, self.max_delay)
+                        # Wait for the calculated delay
+                        delay = next_delay(attempts)
+                        if delay < _SPIN_THRESHOLD:
+                            deadline = perf_counter() + delay
+                            while perf_counter() < deadline:
+                                pass
+                        else:
+                            sleep(delay)
 
-                    # Wait for the calculated delay
-                    sleep(delay)
+            return sync_wrapper
 
         @wraps(func)
         async def async_wrapper(*args, **kwargs) -> Any:
             attempts = 0
 
-            # If tries is negative, allow infinite retries. Use another variable to 
-            # allow infinite values since only float allows this
-            max_retries = self.max_retries if self.max_retries > 0 \
-                else float("inf")
-
             while attempts <= max_retries:
                 try:
                     # Execute function (sync or async based on wrapper)
                     return await func(*args, **kwargs)
                 
-                except self.exceptions as exc: # type: ignore
+                except exceptions as exc: # type: ignore
                     attempts += 1
 
                     if attempts == max_retries:
                         raise MaxRetryExceededError(
-                            "Maximum number of retries ({}) exceeded."
-                            .format(self.max_retries)
+                            f"Maximum number of retries ({self.max_retries}) exceeded."
                         ) from exc
 
-                    # Calculate delay with optional backoff and jitter
-                    delay = self.backoff(self.delay, attempts) if self.backoff \
-                        else self.delay
-                    delay += uniform(-self.jitter, self.jitter)
-
-                    # Cap delay if max_delay is set
-                    if self.max_delay is not None:
-                        delay = min(delay, self.max_delay)
+                    # Still yield to the event loop so that other tasks can 
+                    # run between attempts
+                    if not wait:
+                        await async_sleep(0)
+                        continue
 
                     # Wait for the calculated delay
-                    await async_sleep(delay)
+                    await async_sleep(next_delay(attempts))
+
+        return async_wrapper
+
+
+    async def gather(
+        self, 
+        funcs: Iterable[Callable[[], Awaitable[Any]]], 
+        /, 
+        *, 
+        concurrency: int = 16,
+    ) -> list[Any]:
+        """
+        Runs awaitables concurrently, retrying each one with this decorator's 
+        settings, with at most `concurrency` of them running at a time.
+
+        Sample Usage:
+            results = await retry(max_retries=3, delay=0.5).gather(
+                [lambda url=url: fetch(url) for url in urls], concurrency=8
+            )
+
+        Args:
+            funcs (Iterable[Callable[[], Awaitable[Any]]]): Functions that 
+                take no arguments and return a new awaitable on every call, 
+                since an awaitable cannot be awaited again when retried.
+            concurrency (int): The maximum number of awaitables running at 
+                the same time. Defaults to 16.
+
+        Raises:
+            TypeError: For incorrect argument types.
+            ValueError: For incorrect argument values.
+
+        Returns:
+            list[Any]: The result of each function in the given order, or the 
+                exception it raised, such as MaxRetryExceededError.
+        """
+        if not isinstance(concurrency, int):
+            raise TypeError(
+                f"Type of `concurrency` must be `int`. Got `{type(concurrency).__name__}`."
+            )
+
+        if concurrency < 1:
+            raise ValueError(
+                f"Value of `concurrency` must be a positive integer. Got `{concurrency}`."
+            )
+
+        semaphore = Semaphore(concurrency)
+
+        # Decorate a single coroutine function that awaits a new awaitable 
+        # from the given function, so that functions returning awaitables 
+        # such as lambdas are retried too
+        @self
+        async def call(func: Callable[[], Awaitable[Any]]) -> Any:
+            return await func()
+
+        async def bounded_call(func: Callable[[], Awaitable[Any]]) -> Any:
+            async with semaphore:
+                return await call(func)
 
-        return async_wrapper if iscoroutinefunction(func) else sync_wrapper
\ No newline at end of file
+        return await gather(
+            *(bounded_call(func) for func in funcs), return_exceptions=True
+        )
\ No newline at end of file
@@ -19,6 +19,23 @@ ROMAN_MAPPING = {
     "ones" : ["", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX"],
 }
 
+# Roman numeral of every integer from 1 to 3999, indexed by the integer;
+# Index 0 is an empty string since there is no roman numeral for zero;
+_INTEGER_TO_ROMAN: tuple[str, ...] = tuple(
+    thousands + hundreds + tens + ones
+    for thousands in ROMAN_MAPPING["thousands"]
+    for hundreds in ROMAN_MAPPING["hundreds"]
+    for tens in ROMAN_MAPPING["tens"]
+    for ones in ROMAN_MAPPING["ones"]
+)
+
+# Integer value of every valid uppercase roman numeral from I to MMMCMXCIX;
+# Validating and decoding a roman numeral is a single lookup, as opposed to 
+# matching ROMAN_PATTERN against it;
+_ROMAN_TO_INTEGER: dict[str, int] = {
+    roman: integer for integer, roman in enumerate(_INTEGER_TO_ROMAN) if roman
+}
+
 
 # Validate a roman numeral string
 def validate_roman(
@@ -42,7 +59,7 @@ def validate_roman(
     if not len(roman):
         raise ValueError("roman must not be empty")
     
-    return bool(ROMAN_PATTERN.match(roman))
+    return roman.upper() in _ROMAN_TO_INTEGER
 
 # Converts a roman numeral string into its integer value
 def roman_to_integer(
@@ -61,24 +78,23 @@ def roman_to_integer(
         TypeError: If the roman numeral is not of type `str`.
         ValueError: If the roman numeral is not a valid roman numeral string.
     """
-    if not validate_roman(roman):
-        raise ValueError("roman must be a valid roman numeral string")
+    # Uppercase and look up the roman numeral only once for valid numerals, 
+    # and leave raising the appropriate error to validate_roman otherwise
+    integer = _ROMAN_TO_INTEGER.get(roman.upper()) \
+        if isinstance(roman, str) else None
     
-    thousands, hundreds, tens, ones = re.findall(ROMAN_PATTERN, roman)[0]
+    if integer is None:
+        validate_roman(roman)
+        raise ValueError("roman must be a valid roman numeral string")
     
-    return sum([
-        ROMAN_MAPPING.get("thousands").index(thousands.upper()) * 1000,
-        ROMAN_MAPPING.get("hundreds").index(hundreds.upper()) * 100,
-        ROMAN_MAPPING.get("tens").index(tens.upper()) * 10,
-        ROMAN_MAPPING.get("ones").index(ones.upper()) * 1
-    ])
+    return integer
 
 
 # Converts an integer into its roman numeral string
 def integer_to_roman(
     integer: int,
     /
-) -> int:
+) -> str:
     """Converts an integer into its roman numeral string.
     
     Notes:
@@ -101,12 +117,7 @@ def integer_to_roman(
     if not (1 <= integer <= 3999):
         raise ValueError("integer must be between 1 and 3999, inclusive")
     
-    return "".join([
-        ROMAN_MAPPING.get("thousands")[integer // 1000],
-        ROMAN_MAPPING.get("hundreds")[(integer % 1000) // 100],
-        ROMAN_MAPPING.get("tens")[(integer % 100) // 10],
-        ROMAN_MAPPING.get("ones")[integer % 10]
-    ])
+    return _INTEGER_TO_ROMAN[integer]
     
     
 if __name__ == "__main__":
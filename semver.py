@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
-from functools import total_ordering, singledispatchmethod
-from re import match as _match
+from functools import lru_cache, total_ordering
+import re
 from typing import Self
 
 
@@ -8,18 +8,51 @@ __all__ = ["InvalidSemanticVersionError", "SemanticVersionInfo"]
 __version__ = "1.0.0"
 
 
-SV_PATTERN_PR = r"(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?"
-SV_PATTERN_BM = r"(?:\+(?P<build>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?"
-SV_PATTERN = r"^(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)" + SV_PATTERN_PR + SV_PATTERN_BM + "$"
+_SV_IDENTIFIERS_PR = r"(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*"
+_SV_IDENTIFIERS_BM = r"[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*"
+
+SV_PATTERN_PR = r"(?:-(?P<prerelease>" + _SV_IDENTIFIERS_PR + r"))?"
+SV_PATTERN_BM = r"(?:\+(?P<build>" + _SV_IDENTIFIERS_BM + r"))?"
+SV_PATTERN = r"^(?P<major>[1-9]\d*|0)\.(?P<minor>[1-9]\d*|0)\.(?P<patch>[1-9]\d*|0)" + SV_PATTERN_PR + SV_PATTERN_BM + "$"
+
+# Patterns compiled once; the identifier patterns validate the prerelease and 
+# build fields, which are stored without their leading `-` or `+`
+_SV_RE = re.compile(SV_PATTERN)
+_SV_PR_RE = re.compile(_SV_IDENTIFIERS_PR)
+_SV_BM_RE = re.compile(_SV_IDENTIFIERS_BM)
 
 
 class InvalidSemanticVersionError(ValueError):
     pass
 
 
+# Parses semantic version strings; since versions are immutable, the same 
+# instance is returned for repeated strings, and the cache is bounded since 
+# strings may come from untrusted input
+@lru_cache(maxsize=1024)
+def _parse_str(cls: type, version: str, /):
+    semver_match = _SV_RE.match(version)
+
+    if semver_match is None:
+        raise InvalidSemanticVersionError("Unable to parse string. Invalid semantic versioning: `{}`"
+                                .format(version))
+
+    # Unpack all groups in a single call, in the order they appear in the 
+    # pattern; prerelease and build are None when absent
+    major, minor, patch, prerelease, build = semver_match.groups()
+
+    return cls(int(major), int(minor), int(patch), prerelease or "", build or "")
+
+
+# Holds the memoized result of as_str in a slot declared outside of the 
+# dataclass, so that it does not show up in fields(), asdict(), or astuple()
+class _SemanticVersionCache:
+    __slots__ = ("_str_cache",)
+
+
 @total_ordering
 @dataclass(slots=True, frozen=True, repr=True)
-class SemanticVersionInfo:
+class SemanticVersionInfo(_SemanticVersionCache):
     major: int = 0
     minor: int = 0
     patch: int = 0
@@ -27,73 +60,69 @@ class SemanticVersionInfo:
     build: str = field(default="", compare=False)
 
     # Validation of arguments occurs post init of class
+    # Fields are checked directly instead of through a dict built by as_dict
     def __post_init__(self) -> None:
-        for key, val in self.as_dict().items():
-            if key in ("major", "minor", "patch"):
-                if not isinstance(val, int):
-                    raise TypeError(
-                        "Version `{}` number must be a positive integer. Got `{}` of type `{}`."
-                        .format(key, val, type(val).__name__)
-                    )
-                
-                if val < 0:
-                    raise ValueError(
-                        "Version number must be positive. Got `{}` for key `{}`."
-                        .format(val, key)
-                    )
-                                    
-            elif key in ("prerelease", "build"):
-                if not isinstance(val, str):
-                    raise TypeError("Version `{}` identifier must be a string. Got `{}` of type `{}`."
-                                    .format(key, val, type(val).__name__))
-
-                pattern = SV_PATTERN_PR if key == "prerelease" else SV_PATTERN_BM
-                if _match(pattern, val) is None:
-                    raise ValueError(
-                        f"Invalid version `{key}` identifier. Got `{val}`."
-                    ) 
-
-            else:
+        for key, val in (
+            ("major", self.major), ("minor", self.minor), ("patch", self.patch)
+        ):
+            if not isinstance(val, int):
+                raise TypeError(
+                    "Version `{}` number must be a positive integer. Got `{}` of type `{}`."
+                    .format(key, val, type(val).__name__)
+                )
+            
+            if val < 0:
                 raise ValueError(
-                    "Invalid key `{}`. Expected major, minor, patch, prerelease, or build."
-                    .format(key)
+                    "Version number must be positive. Got `{}` for key `{}`."
+                    .format(val, key)
                 )
+
+        for key, val, pattern in (
+            ("prerelease", self.prerelease, _SV_PR_RE), 
+            ("build", self.build, _SV_BM_RE),
+        ):
+            if not isinstance(val, str):
+                raise TypeError("Version `{}` identifier must be a string. Got `{}` of type `{}`."
+                                .format(key, val, type(val).__name__))
+
+            if val and pattern.fullmatch(val) is None:
+                raise ValueError(
+                    f"Invalid version `{key}` identifier. Got `{val}`."
+                ) 
         
-    @singledispatchmethod
+    # Dispatch on the two supported types with isinstance, which is cheaper 
+    # than a singledispatchmethod registry lookup on every call
     @classmethod
     def parse(cls, version: str | dict[str, int | str], /) -> Self:
+        if isinstance(version, str):
+            return _parse_str(cls, version)
+
+        if isinstance(version, dict):
+            return cls(
+                int(version.get("major", 0)),
+                int(version.get("minor", 0)),
+                int(version.get("patch", 0)),
+                str(version.get("prerelease", "")),
+                str(version.get("build", ""))
+            )
+
         raise NotImplementedError("Unable to parse type `{}` into `{}`"
                         .format(type(version).__name__, cls.__name__))
-    
-    @parse.register
-    @classmethod
-    def _(cls, version: str):
-        semver_match = _match(SV_PATTERN, version)
-
-        if semver_match is None:
-            raise InvalidSemanticVersionError("Unable to parse string. Invalid semantic versioning: `{}`"
-                                    .format(version))
-
-        return cls(
-            int(semver_match.group("major")),
-            int(semver_match.group("minor")),
-            int(semver_match.group("patch")),
-            semver_match.group("prerelease") or "",
-            semver_match.group("build") or "",
-        )
-
-    @parse.register
-    @classmethod
-    def _(cls, version: dict):
-        return cls(
-            int(version.get("major", 0)),
-            int(version.get("minor", 0)),
-            int(version.get("patch", 0)),
-            str(version.get("prerelease", "")),
-            str(version.get("build", ""))
-        )
 
 
+    # Builds an instance from values already known to be valid, skipping the 
+    # checks in __post_init__
+    @classmethod
+    def _unchecked(cls, major: int, minor: int, patch: int, 
+                   prerelease: str = "", build: str = "") -> Self:
+        version = object.__new__(cls)
+        object.__setattr__(version, "major", major)
+        object.__setattr__(version, "minor", minor)
+        object.__setattr__(version, "patch", patch)
+        object.__setattr__(version, "prerelease", prerelease)
+        object.__setattr__(version, "build", build)
+        return version
+
     # Return as tuple, dict, or str types
     
     def as_tuple(self, no_id: bool = False) -> tuple[int, int, int] | tuple[int, int, int, str, str]:
@@ -102,7 +131,10 @@ class SemanticVersionInfo:
         return (self.major, self.minor, self.patch, self.prerelease, self.build)
     
     def as_dict(self, no_id: bool = False) -> dict[str, int | str]:
-        version_dict = {
+        if no_id:
+            return {"major": self.major, "minor": self.minor, "patch": self.patch}
+
+        return {
             "major": self.major,
             "minor": self.minor,
             "patch": self.patch,
@@ -110,13 +142,13 @@ class SemanticVersionInfo:
             "build": self.build 
         }
 
-        if no_id:
-            version_dict.pop("prerelease")
-            version_dict.pop("build")
-
-        return version_dict
-
     def as_str(self) -> str:
+        # The cache slot is unset until the first call
+        try:
+            return self._str_cache
+        except AttributeError:
+            pass
+
         semver = f"{self.major}.{self.minor}.{self.patch}"
 
         if self.prerelease:
@@ -125,18 +157,21 @@ class SemanticVersionInfo:
         if self.build:
             semver += f"+{self.build}"
 
+        # The instance is frozen, so bypass its __setattr__ for the cache
+        object.__setattr__(self, "_str_cache", semver)
         return semver
 
     # Bump versions, return new class instance    
 
+    # Numbers derived from a valid instance stay valid, so no revalidation
     def bump_major(self) -> Self:
-        return self.__class__(self.major + 1, 0, 0)
+        return self._unchecked(self.major + 1, 0, 0)
     
     def bump_minor(self) -> Self:
-        return self.__class__(self.major, self.minor + 1, 0)
+        return self._unchecked(self.major, self.minor + 1, 0)
     
     def bump_patch(self) -> Self:
-        return self.__class__(self.major, self.minor, self.patch + 1)
+        return self._unchecked(self.major, self.minor, self.patch + 1)
     
 
     def __str__(self) -> str:
@@ -144,23 +179,29 @@ class SemanticVersionInfo:
     
     # Comparison operators
     # The rest are filled in by functools.total_ordering
-    # Only compare major, minor, and patch values
+    # Instances are compared on all fields, tuples only on major, minor, and 
+    # patch values
+    # Instances are checked first as the most common operand; tuples, str, 
+    # and dict are handled before falling back to NotImplemented. Equality 
+    # never raises, so that versions can be looked up among other values; 
+    # tuples of the wrong length and unparsable values are simply not equal
     def __eq__(self, other: Self | str | tuple[int, int, int] | dict[str, int | str]) -> bool:
-        if not isinstance(other, type(self)):
-            return NotImplemented
-            # raise TypeError("Cannot compare `{}` with `{}`."
-                            # .format(type(self).__name__, type(other).__name__))
-        if isinstance(other, tuple):
-            if len(other) != 3:
-                raise ValueError("Semantic version tuple must be of length 3. Got `{}`"
-                                 .format(other))
+        if isinstance(other, type(self)):
+            return (self.major, self.minor, self.patch, self.prerelease, self.build) \
+                == (other.major, other.minor, other.patch, other.prerelease, other.build)
 
+        if isinstance(other, tuple):
             return (self.major, self.minor, self.patch) == other
         
         if isinstance(other, str) or isinstance(other, dict):
-            return (self.major, self.minor, self.patch) == self.parse(other)
-
-        return self.as_tuple(no_id=False) == other.as_tuple(no_id=False)
+            try:
+                return self == self.parse(other)
+            except (ValueError, TypeError):
+                return False
+
+        return NotImplemented
+        # raise TypeError("Cannot compare `{}` with `{}`."
+        #                 .format(type(self).__name__, type(other).__name__))
         
     
     def __lt__(self, other: Self | str | tuple[int, int, int] | dict[str, int | str]) -> bool:
@@ -179,18 +220,32 @@ class SemanticVersionInfo:
             # raise TypeError("Cannot compare `{}` with `{}`."
             #                 .format(type(self).__name__, type(other).__name__))
         
-        return self.as_tuple(no_id=False) < other.as_tuple(no_id=False)
+        return (self.major, self.minor, self.patch, self.prerelease, self.build) \
+            < (other.major, other.minor, other.patch, other.prerelease, other.build)
     
     
+    # Dict and tuple operands are compared field by field instead of building 
+    # a throwaway container from self; a missing dict key yields None, which 
+    # never equals a field value
     def compare_strict(self, other: Self | str | tuple[int, int, int, str, str] | dict[str, int | str]) -> bool:
         if isinstance(other, str):
             return self.as_str() == other
         
         elif isinstance(other, dict):
-            return self.as_dict() == other
+            return len(other) == 5 \
+                and other.get("major") == self.major \
+                and other.get("minor") == self.minor \
+                and other.get("patch") == self.patch \
+                and other.get("prerelease") == self.prerelease \
+                and other.get("build") == self.build
         
         elif isinstance(other, tuple):
-            return self.as_tuple() == other
+            return len(other) == 5 \
+                and other[0] == self.major \
+                and other[1] == self.minor \
+                and other[2] == self.patch \
+                and other[3] == self.prerelease \
+                and other[4] == self.build
 
         else:
             raise TypeError("Cannot compare `{}` with `{}`."
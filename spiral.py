@@ -2,7 +2,29 @@ import math
 import time
 import ctypes
 
-from pynput.mouse import Controller
+import numpy as np
+
+
+INPUT_MOUSE = 0
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_ABSOLUTE = 0x8000
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class INPUT(ctypes.Structure):
+    # MOUSEINPUT is the largest member of the INPUT union, so it alone
+    # gives the structure its full size
+    _fields_ = [("type", ctypes.c_ulong), ("mi", MOUSEINPUT)]
 
 
 def main():
@@ -14,28 +36,56 @@ def main():
     # Constants for the spiral motion
     num_turns = 20  # Number of turns in the spiral
     total_steps = 5000  # Total steps to complete the spiral
+    # Steps sent to the system in a single call; moves within a call land at 
+    # once, so this keeps the cursor updating every few milliseconds, faster 
+    # than displays refresh
+    batch_size = 4
 
     # Calculate step size and angle increment for the spiral
     step_size = min(screen_x, screen_y) / total_steps
     angle_increment = (2 * math.pi * num_turns) / total_steps
 
-    # Initialize the mouse controller
-    mouse = Controller()
+    # Precompute every position of the spiral pattern up front
+    steps = np.arange(total_steps)
+    radii = steps * step_size
+    angles = steps * angle_increment
+    xs = (center_x + radii * np.cos(angles)).astype(np.int32)
+    ys = (center_y + radii * np.sin(angles)).astype(np.int32)
+
+    # Absolute mouse input is normalized to the 0..65535 range
+    dxs = xs.astype(np.int64) * 65535 // (screen_x - 1)
+    dys = ys.astype(np.int64) * 65535 // (screen_y - 1)
+
+    # Build every mouse move into one contiguous buffer
+    inputs = (INPUT * total_steps)()
+    flags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE
+    for item, dx, dy in zip(inputs, dxs.tolist(), dys.tolist()):
+        item.type = INPUT_MOUSE
+        item.mi.dx, item.mi.dy, item.mi.dwFlags = dx, dy, flags
+
+    send_input = user32.SendInput
+    input_size = ctypes.sizeof(INPUT)
+
+    # Raise the system timer resolution to 1 ms so short sleeps are not
+    # rounded up to the default ~15.6 ms tick
+    winmm = ctypes.WinDLL("winmm")
+    winmm.timeBeginPeriod(1)
+    try:
+        deadline = time.perf_counter()
+
+        # Move the mouse in a flower spiral pattern
+        for start in range(0, total_steps, batch_size):
+            # Send the next batch of positions in a single call
+            count = min(batch_size, total_steps - start)
+            send_input(count, ctypes.byref(inputs, start * input_size), input_size)
 
-    # Move the mouse in a flower spiral pattern
-    for step in range(total_steps):
-        # Calculate the position of the mouse based on the spiral pattern
-        radius = step * step_size
-        angle = step * angle_increment
-        x = int(center_x + radius * math.cos(angle))
-        y = int(center_y + radius * math.sin(angle))
+            # Sleep until the next deadline to control the speed of the
+            # spiral motion without accumulating drift
+            deadline += 0.001 * count
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+    finally:
+        winmm.timeEndPeriod(1)
 
-        # Move the mouse to the calculated position
-        mouse.position = (x, y)
 
-        # Add a slight delay to control the speed of the spiral motion
-        time.sleep(0.001)
-        
-        
 if __name__ == "__main__":
     main()